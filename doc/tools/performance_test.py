@@ -17,9 +17,9 @@ def main():
     ranger.args.debug = False
 
     settings = ranger.container.settings.Settings()
-    ranger.core.shared.SettingsAware.settings_set( settings )
+    ranger.core.shared.SettingsAware.settings = settings
     fm = ranger.core.fm.FM()
-    ranger.core.shared.FileManagerAware.fm_set( fm )
+    ranger.core.shared.FileManagerAware.fm = fm
 
     time1 = time.time()
     fm.initialize()
@@ -14,7 +14,7 @@ import os
 def version_helper():
     if __release__:
         version_string = f'ranger {__version__}'
-    else:
+    elif os.environ.get('RANGER_USE_GIT_DESCRIBE') == '1':
         import subprocess
         try:
             with subprocess.Popen( ["git", "describe"], universal_newlines=True, cwd=RANGERDIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE ) as git_describe:
@@ -22,9 +22,57 @@ def version_helper():
             version_string = f'ranger-master {git_description.strip('\n')}'
         except (OSError, subprocess.CalledProcessError, AttributeError):
             version_string = f'ranger-master {__version__}+dev'
+    else:
+        version_string = f'ranger-master {_read_git_description(RANGERDIR)}'
     return version_string
 
 
+def _read_git_description(path):
+    """Describe the checked out commit by reading .git directly instead of running git"""
+    path = os.path.abspath(path)
+    while not os.path.exists(os.path.join(path, '.git')):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return f'{__version__}+dev'
+        path = parent
+    gitdir = os.path.join(path, '.git')
+
+    try:
+        if os.path.isfile(gitdir):
+            # Worktrees and submodules link to their real git directory
+            with open(gitdir, encoding='utf-8') as link_file:
+                link = link_file.read().strip()
+            if not link.startswith('gitdir: '):
+                return f'{__version__}+dev'
+            gitdir = os.path.join(path, link[8:])
+        # Worktrees keep their own HEAD but share the refs of the main repository
+        commondir = gitdir
+        if os.path.isfile(os.path.join(gitdir, 'commondir')):
+            with open(os.path.join(gitdir, 'commondir'), encoding='utf-8') as commondir_file:
+                commondir = os.path.join(gitdir, commondir_file.read().strip())
+
+        with open(os.path.join(gitdir, 'HEAD'), encoding='utf-8') as head_file:
+            sha = head_file.read().strip()
+        if sha.startswith('ref: '):
+            ref = sha[5:]
+            try:
+                with open(os.path.join(commondir, ref), encoding='utf-8') as ref_file:
+                    sha = ref_file.read().strip()
+            except FileNotFoundError:
+                # The ref may only exist in packed-refs after a "git gc"
+                sha = ''
+                with open(os.path.join(commondir, 'packed-refs'), encoding='utf-8') as packed_refs:
+                    for line in packed_refs:
+                        if line.rstrip('\n').endswith(' ' + ref):
+                            sha = line.split(' ', 1)[0]
+                            break
+    except OSError:
+        sha = ''
+    if not sha:
+        return f'{__version__}+dev'
+    return f'{__version__}+{sha[:7]}'
+
+
 # Information
 __license__ = 'GPL3'
 __version__ = '1.9.3'
@@ -41,12 +89,21 @@ MACRO_DELIMITER = '%'
 MACRO_DELIMITER_ESC = '%%'
 DEFAULT_PAGER = 'less'
 USAGE = '%prog [options] [path]'
-VERSION = version_helper()
 
 # These variables are ignored if the corresponding
 # XDG environment variable is non-empty and absolute
-CACHEDIR = os.path.expanduser('~/.cache/ranger')
-CONFDIR = os.path.expanduser('~/.config/ranger')
-DATADIR = os.path.expanduser('~/.local/share/ranger')
+# expanduser() falls back to the passwd database if $HOME is unset, so only do that once
+_HOME = os.environ.get('HOME') or os.path.expanduser('~')
+CACHEDIR = os.path.join(_HOME, '.cache/ranger')
+CONFDIR = os.path.join(_HOME, '.config/ranger')
+DATADIR = os.path.join(_HOME, '.local/share/ranger')
 
 args = None  # pylint: disable=invalid-name
+
+
+def __getattr__(name):
+    # VERSION is computed on first access, importing ranger shouldn't have to look at .git
+    if name == 'VERSION':
+        version = globals()['VERSION'] = version_helper()
+        return version
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -193,6 +193,7 @@ class FM(ranger.core.actions.Actions, ranger.ext.signals.SignalDispatcher):   #
         def mylogfunc(text: str):
             self.notify(text, bad=True)
         self.run = ranger.core.runner.Runner( ui=self.ui, logfunc=mylogfunc, fm=self )
+        self.run.install_sigchld_handler()
 
         self.settings.signal_bind(
             'setopt.metadata_deep_search',
@@ -217,6 +218,8 @@ class FM(ranger.core.actions.Actions, ranger.ext.signals.SignalDispatcher):   #
             except Exception:  # pylint: disable=broad-except
                 if debug:
                     raise
+        if self.run:
+            self.run.close()
 
     @staticmethod
     def get_log():
@@ -423,7 +426,7 @@ class FM(ranger.core.actions.Actions, ranger.ext.signals.SignalDispatcher):   #
                 if zombies:
                     for zombie in tuple(zombies):
                         if zombie.poll() is not None:
-                            zombies.remove(zombie)
+                            zombies.discard(zombie)
 
                 # gc_tick += 1
                 # if gc_tick > ranger.TICKS_BEFORE_COLLECTING_GARBAGE:
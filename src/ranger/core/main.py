@@ -16,11 +16,13 @@ import ranger.api.commands
 
 LOG = getLogger(__name__)
 
-VERSION_MSG: list[str] = [
-    f'ranger version: {ranger.VERSION}',
-    f'Python version: {' '.join(line.strip() for line in sys.version.splitlines())}',
-    f'Locale: {'.'.join(str(s) for s in locale.getlocale())}',
-]
+
+def version_msg() -> list[str]:
+    return [
+        f'ranger version: {ranger.VERSION}',
+        f'Python version: {' '.join(line.strip() for line in sys.version.splitlines())}',
+        f'Locale: {'.'.join(str(s) for s in locale.getlocale())}',
+    ]
 
 
 def main() -> int:  # pylint: disable=too-many-locals,too-many-return-statements,disable=too-many-branches,too-many-statements
@@ -35,7 +37,7 @@ def main() -> int:  # pylint: disable=too-many-locals,too-many-return-statements
     ranger.arg = ranger.ext.openstruct.OpenStruct( args.__dict__ )  # COMPAT
     ranger.ext.logutils.setup_logging(debug=args.debug, logfile=args.logfile)
 
-    for line in VERSION_MSG:
+    for line in version_msg():
         LOG.info(line)
     LOG.info('Process ID: %s', os.getpid())
 
@@ -81,7 +83,7 @@ def main() -> int:  # pylint: disable=too-many-locals,too-many-return-statements
                 sys.stdout.write(line)
         return 0
 
-    ranger.core.shared.SettingsAware.settings_set(ranger.container.settings.Settings())
+    ranger.core.shared.SettingsAware.settings = ranger.container.settings.Settings()
 
     # TODO: deprecate --selectfile
     if args.selectfile:
@@ -109,7 +111,7 @@ def main() -> int:  # pylint: disable=too-many-locals,too-many-return-statements
     try:  # pylint: disable=too-many-nested-blocks
         # Initialize objects
         fm = ranger.core.fm.FM(paths=paths)
-        ranger.core.shared.FileManagerAware.fm_set(fm)
+        ranger.core.shared.FileManagerAware.fm = fm
         load_settings(fm, args.clean)
 
         if args.show_only_dirs:
@@ -205,7 +207,7 @@ def main() -> int:  # pylint: disable=too-many-locals,too-many-return-statements
     except Exception:  # pylint: disable=broad-except
         import traceback
         ex_traceback = traceback.format_exc()
-        exit_msg += '\n'.join(VERSION_MSG) + '\n'
+        exit_msg += '\n'.join(version_msg()) + '\n'
         try:
             exit_msg += f"Current file: {repr(fm.thisfile.path)}\n"
         except Exception:  # pylint: disable=broad-except
@@ -277,7 +279,7 @@ def parse_arguments():
     from optparse import OptionParser  # pylint: disable=deprecated-module
     from ranger import CONFDIR, CACHEDIR, DATADIR, USAGE
 
-    parser = OptionParser(usage=USAGE, version=('\n'.join(VERSION_MSG)))
+    parser = OptionParser(usage=USAGE, version=('\n'.join(version_msg())))
 
     parser.add_option('-d', '--debug', action='store_true',
                       help="activate debug mode")
@@ -21,27 +21,64 @@ r: run application with root privilege (requires sudo or doas).
 t: run application in a new terminal window.
 (An uppercase key negates the respective lower case flag)
 """
-import logging
+import functools
 import os
+import signal
 import sys
-import io
 import subprocess
 import typing
 
 import ranger.ext.get_executables
-import ranger.ext.popen_forked
-import ranger.container.file
-import ranger.core.fm
-import ranger.gui.ui
+if typing.TYPE_CHECKING:
+    import ranger.container.file
+    import ranger.core.fm
+    import ranger.gui.ui
 
 
-LOG = logging.getLogger(__name__)
+@functools.cache
+def _logger():
+    # Only needed when the UI fails, so don't import logging up front
+    import logging
+    return logging.getLogger(__name__)
+
+
+# Module level aliases, Runner.__call__ runs between a key press and the launch
+_PIPE = subprocess.PIPE
+_STDOUT = subprocess.STDOUT
+_Popen = subprocess.Popen
 
 
 # TODO: Remove unused parts of runner.py
 # ALLOWED_FLAGS = 'sdpwcrtSDPWCRT'
 ALLOWED_FLAGS = 'cfrtCFRT'
 
+# Every flag handled by Runner.__call__ gets one bit of Context.flag_mask
+FLAG_SILENT = 1 << 0
+FLAG_PAGER = 1 << 1
+FLAG_FORK = 1 << 2
+FLAG_WAIT = 1 << 3
+FLAG_CURRENT = 1 << 4
+FLAG_ROOT = 1 << 5
+FLAG_TERMINAL = 1 << 6
+_FLAG_CHARS = 'spfwcrt'
+_FLAG_BIT: dict[str, int] = { char: 1 << i for i, char in enumerate( _FLAG_CHARS ) }
+_FLAG_BIT.update( { char.upper(): bit for char, bit in _FLAG_BIT.items() } )
+_MASK_TO_STR: tuple[str, ...] = tuple(
+    ''.join( char for i, char in enumerate( _FLAG_CHARS ) if mask & (1 << i) )
+    for mask in range( 1 << len( _FLAG_CHARS ) )
+)
+
+
+@functools.cache
+def _pager() -> str:
+    # Resolved on first use, most sessions never pipe anything to the pager
+    import shutil
+    return shutil.which(ranger.DEFAULT_PAGER) or ranger.DEFAULT_PAGER
+
+
+# Popen keywords Runner.__call__ sets itself, anything else came from the caller
+_RUNNER_KWS = frozenset(('args', 'shell', 'executable', 'stdin', 'stdout', 'stderr'))
+
 
 class Context:
     """A context object contains data on how to run a process.
@@ -58,18 +95,22 @@ class Context:
     fm -- the filemanager instance
     wait -- boolean, wait for the end or execute programs in parallel?
     popen_kws -- keyword arguments which are directly passed to Popen
+    flag_mask -- the squashed flags as a bitmask of FLAG_* constants
     """
+    __slots__ = ('action', 'app', 'mode', 'flags', 'files', 'file', 'fm', 'wait', 'popen_kws', 'flag_mask')
+
     action: str
     app: str
     mode: int
     flags: str
-    files: list[ranger.container.file.File]
-    file: ranger.container.file.File | None
+    files: list[ 'ranger.container.file.File' ]
+    file: typing.Union['ranger.container.file.File', None]
     fm: 'ranger.core.fm.FM'
     wait: bool
     popen_kws: dict[str, object]
+    flag_mask: int
 
-    def __init__(self, action: str = None, app: str = None, mode: int = None, flags: str = None, files: list[ranger.container.file.File] = None, file=None, fm=None, wait=None, popen_kws=None):
+    def __init__(self, action: str = None, app: str = None, mode: int = None, flags: str = None, files: list[ 'ranger.container.file.File' ] = None, file=None, fm=None, wait=None, popen_kws=None):
         self.action = action
         self.app = app
         self.mode = mode
@@ -79,37 +120,83 @@ class Context:
         self.fm = fm
         self.wait = wait
         self.popen_kws = popen_kws
+        self.flag_mask = 0
 
     @property
     def filepaths(self):
-        try:
-            return [ f.path for f in self.files ]
-        except AttributeError:
-            return []
+        files = self.files
+        return [ f.path for f in files ] if files else []
 
     def __iter__(self):
         """Iterate over file paths"""
-        yield from self.filepaths
+        files = self.files
+        if files:
+            for f in files:
+                yield f.path
 
     def squash_flags(self):
         """Remove duplicates and lowercase counterparts of uppercase flags"""
+        pos = neg = 0
         for flag in self.flags:
-            if ord(flag) <= 90:
-                bad = flag + flag.lower()
-                self.flags = ''.join(c for c in self.flags if c not in bad)
+            if flag.isupper():
+                neg |= _FLAG_BIT.get(flag, 0)
+            else:
+                pos |= _FLAG_BIT.get(flag, 0)
+        self.flag_mask = pos & ~neg
+        self.flags = _MASK_TO_STR[self.flag_mask]
 
 
 class Runner:
-    ui: ranger.gui.ui.UI | None
+    ui: typing.Union['ranger.gui.ui.UI', None]
     fm: typing.Union['ranger.core.fm.FM', None]
     logfunc: typing.Callable[[str], None] | None
     zombies: set[ subprocess.Popen ]
+    _devnull_r: int
+    _devnull_w: int
 
-    def __init__(self, ui: ranger.gui.ui.UI = None, logfunc: typing.Callable[[str], None] = None, fm: 'ranger.core.fm.FM' = None):
+    def __init__(self, ui: 'ranger.gui.ui.UI' = None, logfunc: typing.Callable[[str], None] = None, fm: 'ranger.core.fm.FM' = None):
         self.ui = ui
         self.fm = fm
         self.logfunc = logfunc
         self.zombies = set()
+        # Kept open for the lifetime of the runner and shared by all silent processes
+        self._devnull_r = os.open(os.devnull, os.O_RDONLY)
+        self._devnull_w = os.open(os.devnull, os.O_WRONLY)
+
+    def close(self) -> None:
+        """Release the /dev/null descriptors, the runner can't run silent processes afterwards"""
+        os.close(self._devnull_r)
+        os.close(self._devnull_w)
+
+    def install_sigchld_handler(self) -> None:
+        """Reap background processes from a SIGCHLD handler.
+
+        This replaces the process-wide SIGCHLD handler, so only the runner
+        of the FM should do it, from the main thread.
+        """
+        if hasattr(signal, 'SIGCHLD'):
+            # Every child exit, including previews, interrupts the poll() behind
+            # curses' halfdelay getch(), which then returns -1 early.  UI.handle_input
+            # treats that like the regular idle timeout, the main loop just runs sooner.
+            signal.signal(signal.SIGCHLD, self._on_sigchld)
+
+    def _on_sigchld(self, signum, frame) -> None:  # pylint: disable=unused-argument
+        """Reap finished background processes as soon as they exit"""
+        # Python runs signal handlers in the main thread, between two bytecodes,
+        # so iterating over a copy is enough to not trip over zombies.add()
+        for zombie in tuple(self.zombies):
+            if zombie.poll() is not None:
+                self.zombies.discard(zombie)
+
+    @staticmethod
+    def invalidate_env() -> None:
+        """Forget the cached executables and pager.
+
+        Nothing watches the environment, so whoever changes $PATH (e.g. a
+        plugin) has to call this for the runner to notice.
+        """
+        ranger.ext.get_executables.clear_executables_cache()
+        _pager.cache_clear()
 
     def _log(self, text: str) -> bool:
         try:
@@ -126,13 +213,28 @@ class Runner:
                 self.ui.initialize()
             except Exception as ex:
                 self._log("Failed to initialize UI")
-                LOG.exception(ex)
+                _logger().exception(ex)
         else:
             try:
                 self.ui.suspend()
             except Exception as ex:
                 self._log("Failed to suspend UI")
-                LOG.exception(ex)
+                _logger().exception(ex)
+
+    def _page( self, process: subprocess.Popen ) -> subprocess.Popen | None:
+        """Show the piped output of the process in the pager"""
+        self._activate_ui(False)
+        pager = None
+        try:
+            pager = _Popen([_pager()], stdin=process.stdout, stdout=sys.stdout, stderr=sys.stderr)
+            # The pager holds its own copy now, this lets the process get SIGPIPE once the pager quits
+            process.stdout.close()
+            pager.wait()
+        except OSError as ex:
+            self._log( f"Failed to run: {_pager()}\n{ex}" )
+        finally:
+            self._activate_ui(True)
+        return pager
 
     def __call__( self, action=None, try_app_first=False, app='default', files=None, mode=0, flags='', wait=True, **popen_kws ):
         """Run the application in the way specified by the options.
@@ -155,7 +257,7 @@ class Runner:
         # Preconditions
 
         context.squash_flags()
-        popen_kws = context.popen_kws  # shortcut
+        flag_mask = context.flag_mask
 
         toggle_ui = True
         pipe_output = False
@@ -175,45 +277,42 @@ class Runner:
             popen_kws['stderr'] = sys.stderr
 
         # Evaluate the flags to determine keywords for Popen() and other variables
-        if 'p' in context.flags:  # redirect output to the pager.
-            popen_kws['stdout'] = subprocess.PIPE
-            popen_kws['stderr'] = subprocess.STDOUT
+        if flag_mask & FLAG_PAGER:  # redirect output to the pager.
+            popen_kws['stdout'] = _PIPE
+            popen_kws['stderr'] = _STDOUT
             toggle_ui = False
             pipe_output = True
             context.wait = False
-        if 's' in context.flags:  # silent mode. output will be discarded.
-            # Using a with-statement for these is inconvenient.
-            devnull_writable = io.open(os.devnull, 'w', encoding="utf-8")
-            devnull_readable = io.open(os.devnull, 'r', encoding="utf-8")
-            popen_kws['stdout'] = devnull_writable
-            popen_kws['stderr'] = devnull_writable
-            popen_kws['stdin'] = devnull_readable
+        if flag_mask & FLAG_SILENT:  # silent mode. output will be discarded.
+            popen_kws['stdout'] = self._devnull_w
+            popen_kws['stderr'] = self._devnull_w
+            popen_kws['stdin'] = self._devnull_r
             toggle_ui = False
-        if 'f' in context.flags:  # fork the process.
+        if flag_mask & FLAG_FORK:  # fork the process.
             toggle_ui = False
             context.wait = False
-        if 'w' in context.flags:  # wait for enter-press afterward.
+        if flag_mask & FLAG_WAIT:  # wait for enter-press afterward.
             if not pipe_output and context.wait:  # <-- sanity check
                 wait_for_enter = True
-        if 'r' in context.flags:  # run application with root privilege (requires sudo).
+        if flag_mask & FLAG_ROOT:  # run application with root privilege (requires sudo).
             # TODO: make 'r' flag work with pipes
             if 'sudo' not in ranger.ext.get_executables.get_executables():
                 return self._log("Can not run with 'r' flag, sudo is not installed!")
-            f_flag = 'f' in context.flags
             if isinstance(action, str):
-                action = 'sudo ' + (f_flag and '-b ' or '') + action
+                action = 'sudo -b ' + action if flag_mask & FLAG_FORK else 'sudo ' + action
             else:
-                action = ['sudo'] + (f_flag and ['-b'] or []) + action
+                action = ['sudo', '-b', *action] if flag_mask & FLAG_FORK else ['sudo', *action]
             toggle_ui = True
             context.wait = True
-        if 't' in context.flags:  # run application in a new terminal window.
-            if not ('WAYLAND_DISPLAY' in os.environ or sys.platform == 'darwin' or 'DISPLAY' in os.environ):
+        if flag_mask & FLAG_TERMINAL:  # run application in a new terminal window.
+            environ = os.environ
+            if not ('WAYLAND_DISPLAY' in environ or sys.platform == 'darwin' or 'DISPLAY' in environ):
                 return self._log("Can not run with 't' flag, no display found!")
             term = ranger.ext.get_executables.get_term()
             if isinstance(action, str):
                 action = term + ' -e ' + action
             else:
-                action = [term, '-e'] + action
+                action = [term, '-e', *action]
             toggle_ui = False
             context.wait = False
 
@@ -227,14 +326,22 @@ class Runner:
         process: subprocess.Popen | None = None
 
         try:
-            self.fm.signal_emit('runner.execute.before', popen_kws=popen_kws, context=context)
+            if self.fm.signal_has_handlers('runner.execute.before'):
+                self.fm.signal_emit('runner.execute.before', popen_kws=popen_kws, context=context)
             try:
-                if 'f' in context.flags and 'r' not in context.flags:
+                if flag_mask & (FLAG_FORK | FLAG_ROOT) == FLAG_FORK:
                     # This can fail and return False if os.fork() is not
                     # supported, but we assume it is, since curses is used.
-                    ranger.ext.popen_forked.Popen_forked(**popen_kws)
+                    from ranger.ext.popen_forked import Popen_forked
+                    if popen_kws.keys() <= _RUNNER_KWS:
+                        # Popen_forked replaces stdin, stdout and stderr with /dev/null anyway
+                        Popen_forked(
+                            popen_kws['args'], shell=popen_kws['shell'], executable=popen_kws.get('executable')
+                        )
+                    else:
+                        Popen_forked(**popen_kws)
                 else:
-                    process = subprocess.Popen(**popen_kws)
+                    process = _Popen(**popen_kws)
             except OSError as ex:
                 error = ex
                 self._log( f"Failed to run: {action}\n{ex}" )
@@ -247,9 +354,10 @@ class Runner:
                     sys.stdout.write("Press ENTER to continue")
                     input()
         finally:
-            self.fm.signal_emit('runner.execute.after', popen_kws=popen_kws, context=context, error=error)
+            if self.fm.signal_has_handlers('runner.execute.after'):
+                self.fm.signal_emit('runner.execute.after', popen_kws=popen_kws, context=context, error=error)
             if toggle_ui:
                 self._activate_ui(True)
             if pipe_output and process:
-                return self(action='less', app='pager', try_app_first=True, stdin=process.stdout)
+                return self._page(process)
             return process  # pylint: disable=lost-exception
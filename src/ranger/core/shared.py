@@ -11,15 +11,7 @@ class FileManagerAware:  # pylint: disable=too-few-public-methods
     """Subclass this to gain access to the global "FM" object."""
     fm: typing.ClassVar[ 'ranger.core.fm.FM' ]
 
-    @staticmethod
-    def fm_set( fm: 'ranger.core.fm.FM' ) -> None:
-        FileManagerAware.fm = fm
 
-
-class SettingsAware:
+class SettingsAware:  # pylint: disable=too-few-public-methods
     """Subclass this to gain access to the global "SettingObject" object."""
     settings: typing.ClassVar[ 'ranger.container.settings.Settings' ]
-
-    @staticmethod
-    def settings_set( settings: 'ranger.container.settings.Settings' ) -> None:
-        SettingsAware.settings = settings
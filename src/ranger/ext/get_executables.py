@@ -22,6 +22,12 @@ def get_executables():
     return _cached_executables
 
 
+def clear_executables_cache():
+    """Make the next get_executables() call walk $PATH again."""
+    global _cached_executables  # pylint: disable=global-statement,invalid-name
+    _cached_executables = None
+
+
 def _in_wsl():
     # Check if the current environment is Microsoft WSL instead of native Linux
     # WSL 2 has `WSL2` in the release string but WSL 1 does not, both contain
@@ -171,6 +171,23 @@ class SignalDispatcher:
         except IndexError:
             pass
 
+    def signal_has_handlers(self, signal_name: str) -> bool:
+        """Check whether emitting the signal would call any function.
+
+        Lets callers skip building expensive signal arguments.
+
+        >>> sig = SignalDispatcher()
+        >>> sig.signal_has_handlers('test')
+        False
+        >>> handler = sig.signal_bind('test', lambda: None)
+        >>> sig.signal_has_handlers('test')
+        True
+        >>> sig.signal_unbind(handler)
+        >>> sig.signal_has_handlers('test')
+        False
+        """
+        return bool(self._signals.get(signal_name))
+
     def signal_garbage_collect(self):
         """Remove all handlers with deleted weak references.
 
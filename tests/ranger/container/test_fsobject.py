@@ -3,6 +3,7 @@ from __future__ import (absolute_import, division, print_function)
 import operator
 
 from ranger.container.fsobject import FileSystemObject
+from ranger.core.shared import FileManagerAware
 
 
 class MockFM:  # pylint: disable=too-few-public-methods
@@ -14,7 +15,7 @@ class MockFM:  # pylint: disable=too-few-public-methods
 def create_filesystem_object(path):
     """Create a FileSystemObject without an fm object."""
     fso = FileSystemObject(path)
-    fso.fm_set(MockFM())
+    FileManagerAware.fm = MockFM()
     return fso
 
 
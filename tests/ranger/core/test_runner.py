@@ -0,0 +1,66 @@
+from __future__ import (absolute_import, division, print_function)
+
+import signal
+import subprocess
+import time
+
+import pytest
+
+from ranger.core.runner import Context, Runner, FLAG_FORK, FLAG_PAGER, FLAG_SILENT
+
+
+class MockFM:  # pylint: disable=too-few-public-methods
+    """Used to fulfill the dependency by Runner."""
+
+    def signal_has_handlers(self, signal_name):  # pylint: disable=unused-argument
+        return False
+
+
+def squashed(flags):
+    context = Context(flags=flags)
+    context.squash_flags()
+    return context
+
+
+def test_squash_flags():
+    assert squashed('').flags == ''
+    assert squashed('ff').flags == 'f'
+    assert squashed('fF').flags == ''
+    assert squashed('Ff').flags == ''
+    assert squashed('psF').flags == 'sp'
+    assert squashed('xyz').flags == ''
+
+
+def test_squash_flags_mask():
+    assert squashed('fps').flag_mask == FLAG_FORK | FLAG_PAGER | FLAG_SILENT
+    assert squashed('fpsP').flag_mask == FLAG_FORK | FLAG_SILENT
+
+
+def test_filepaths():
+    class MockFile:  # pylint: disable=too-few-public-methods
+        def __init__(self, path):
+            self.path = path
+
+    context = Context(files=[MockFile('/a'), MockFile('/b')])
+    assert context.filepaths == ['/a', '/b']
+    assert list(context) == ['/a', '/b']
+    assert Context().filepaths == []
+    assert list(Context()) == []
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGCHLD'), reason="needs SIGCHLD")
+def test_sigchld_reaps_zombies():
+    runner = Runner(fm=MockFM())
+    previous_handler = signal.getsignal(signal.SIGCHLD)
+    runner.install_sigchld_handler()
+    try:
+        process = runner(['sleep', '0.2'], wait=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        assert process in runner.zombies
+        deadline = time.monotonic() + 5
+        while runner.zombies and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not runner.zombies
+        assert process.returncode == 0
+    finally:
+        signal.signal(signal.SIGCHLD, previous_handler)
+        runner.close()
@@ -0,0 +1,56 @@
+from __future__ import (absolute_import, division, print_function)
+
+import ranger
+from ranger import _read_git_description
+
+SHA = '0123456789abcdef0123456789abcdef01234567'
+
+
+def make_repo(path, head='ref: refs/heads/master\n'):
+    gitdir = path / '.git'
+    (gitdir / 'refs' / 'heads').mkdir(parents=True)
+    (gitdir / 'HEAD').write_text(head)
+    return gitdir
+
+
+def test_loose_ref(tmp_path):
+    gitdir = make_repo(tmp_path)
+    (gitdir / 'refs' / 'heads' / 'master').write_text(SHA + '\n')
+    (tmp_path / 'src').mkdir()
+    assert _read_git_description(tmp_path / 'src') == f'{ranger.__version__}+0123456'
+
+
+def test_packed_refs(tmp_path):
+    gitdir = make_repo(tmp_path)
+    (gitdir / 'packed-refs').write_text(
+        '# pack-refs with: peeled fully-peeled sorted\n'
+        f'{"f" * 40} refs/heads/other\n'
+        f'{SHA} refs/heads/master\n'
+    )
+    assert _read_git_description(tmp_path) == f'{ranger.__version__}+0123456'
+
+
+def test_detached_head(tmp_path):
+    make_repo(tmp_path, head=SHA + '\n')
+    assert _read_git_description(tmp_path) == f'{ranger.__version__}+0123456'
+
+
+def test_worktree(tmp_path):
+    gitdir = make_repo(tmp_path / 'main')
+    (gitdir / 'refs' / 'heads' / 'feature').write_text(SHA + '\n')
+    worktree_gitdir = gitdir / 'worktrees' / 'feature'
+    worktree_gitdir.mkdir(parents=True)
+    (worktree_gitdir / 'HEAD').write_text('ref: refs/heads/feature\n')
+    (worktree_gitdir / 'commondir').write_text('../..\n')
+    (tmp_path / 'feature').mkdir()
+    (tmp_path / 'feature' / '.git').write_text(f'gitdir: {worktree_gitdir}\n')
+    assert _read_git_description(tmp_path / 'feature') == f'{ranger.__version__}+0123456'
+
+
+def test_no_checkout(tmp_path):
+    assert _read_git_description(tmp_path) == f'{ranger.__version__}+dev'
+
+
+def test_unreadable_git_file(tmp_path):
+    (tmp_path / '.git').write_text('garbage\n')
+    assert _read_git_description(tmp_path) == f'{ranger.__version__}+dev'